@@ -0,0 +1,16 @@
+`default_nettype none
+`timescale 1us / 1ns
+
+/* Free-running 100 KHz clock, used instead of the cocotb Clock when
+   running with COCOTB_HDL_CLOCK=1. The period must match CLOCK_PERIOD_US
+   in test.py.
+*/
+module clkgen (
+    output reg clk
+);
+
+  initial clk = 1'b0;
+
+  always #5 clk = ~clk;
+
+endmodule
@@ -0,0 +1,91 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+#include "verilated_timing.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    CData/*0:0*/ tb__DOT__clk;
+    CData/*0:0*/ tb__DOT__rst_n;
+    CData/*0:0*/ tb__DOT__ena;
+    CData/*7:0*/ tb__DOT__ui_in;
+    CData/*7:0*/ tb__DOT__uio_in;
+    CData/*7:0*/ tb__DOT__uo_out;
+    CData/*7:0*/ tb__DOT__uio_oe;
+    CData/*0:0*/ tb__DOT__halted;
+    CData/*2:0*/ tb__DOT__user_project__DOT__state;
+    CData/*7:0*/ tb__DOT__user_project__DOT__PC;
+    CData/*7:0*/ tb__DOT__user_project__DOT__prog_uo_out;
+    CData/*0:0*/ tb__DOT__user_project__DOT__prev_run;
+    CData/*7:0*/ tb__DOT__user_project__DOT__prev_A;
+    CData/*1:0*/ tb__DOT__user_project__DOT__prev_B_low;
+    CData/*7:0*/ tb__DOT__user_project__DOT__reg_C;
+    CData/*7:0*/ tb__DOT__user_project__DOT__next_PC;
+    CData/*7:0*/ tb__DOT__user_project__DOT__wr_addr;
+    CData/*7:0*/ tb__DOT__user_project__DOT__wr_byte;
+    CData/*7:0*/ tb__DOT__user_project__DOT__ra_addr;
+    CData/*7:0*/ tb__DOT__user_project__DOT__rb_addr;
+    CData/*0:0*/ tb__DOT__user_project__DOT__out_strobe;
+    CData/*0:0*/ tb__DOT__user_project__DOT__mem__DOT__ra_special;
+    CData/*0:0*/ tb__DOT__user_project__DOT__mem__DOT__rb_special;
+    CData/*0:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_a;
+    CData/*0:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_b;
+    CData/*0:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena;
+    CData/*0:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena;
+    CData/*0:0*/ __VstlFirstIteration;
+    CData/*0:0*/ __VstlPhaseResult;
+    CData/*0:0*/ __VicoFirstIteration;
+    CData/*0:0*/ __VicoPhaseResult;
+    CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__rst_n__0;
+    CData/*0:0*/ __Vtrigprevexpr_h3d519a83__1;
+    CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__clk__0;
+    CData/*0:0*/ __VactPhaseResult;
+    CData/*0:0*/ __VinactPhaseResult;
+    CData/*0:0*/ __VnbaPhaseResult;
+    SData/*15:0*/ tb__DOT__out_fifo_count;
+    VlWide<64>/*2047:0*/ tb__DOT__out_fifo;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__ra_data;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__rb_data;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__w_data;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_ra_data;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_rb_data;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_ra_data;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_rb_data;
+    IData/*31:0*/ __VactIterCount;
+    IData/*31:0*/ __VinactIterCount;
+    IData/*31:0*/ __Vi;
+    QData/*63:0*/ tb__DOT__user_project__DOT__mem__DOT__inst_data;
+    VlUnpacked<IData/*31:0*/, 32> tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage;
+    VlUnpacked<IData/*31:0*/, 32> tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage;
+    VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VactTriggeredAcc;
+    VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+    VlDelayScheduler __VdlySched;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,895 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf);
+VlCoroutine Vtop___024root___eval_initial__TOP__Vtiming__0(Vtop___024root* vlSelf);
+
+void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_initial__TOP(vlSelf);
+    Vtop___024root___eval_initial__TOP__Vtiming__0(vlSelf);
+}
+
+VlCoroutine Vtop___024root___eval_initial__TOP__Vtiming__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP__Vtiming__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    while (VL_LIKELY(!vlSymsp->_vm_contextp__->gotFinish())) {
+        co_await vlSelfRef.__VdlySched.delay(0x0000000000001388ULL, 
+                                             nullptr, 
+                                             "/root/package/test/clkgen.v", 
+                                             14);
+        vlSelfRef.tb__DOT__clk = (1U & (~ (IData)(vlSelfRef.tb__DOT__clk)));
+    }
+    co_return;
+}
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*7:0*/ tb__DOT__user_project__DOT__result;
+    tb__DOT__user_project__DOT__result = 0;
+    CData/*0:0*/ tb__DOT__user_project__DOT__wr_en;
+    tb__DOT__user_project__DOT__wr_en = 0;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__rb_data_actual;
+    tb__DOT__user_project__DOT__mem__DOT__rb_data_actual = 0;
+    // Body
+    tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_special)
+            ? (((IData)(vlSelfRef.tb__DOT__ui_in) << 8U) 
+               | (0x000000ffU & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data))
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data);
+    tb__DOT__user_project__DOT__wr_en = (1U & ((0U 
+                                                == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                                ? (IData)(
+                                                          (8U 
+                                                           == 
+                                                           (9U 
+                                                            & (IData)(vlSelfRef.tb__DOT__uio_in))))
+                                                : (
+                                                   (1U 
+                                                    != (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)) 
+                                                   && (2U 
+                                                       == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)))));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena 
+        = ((~ ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+               >> 7U)) & (IData)(tb__DOT__user_project__DOT__wr_en));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena 
+        = ((IData)(tb__DOT__user_project__DOT__wr_en) 
+           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+              >> 7U));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+        = ((((QData)((IData)(tb__DOT__user_project__DOT__mem__DOT__rb_data_actual)) 
+             << 0x00000020U) | (QData)((IData)(((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_special)
+                                                 ? 
+                                                (((IData)(vlSelfRef.tb__DOT__ui_in) 
+                                                  << 8U) 
+                                                 | (0x000000ffU 
+                                                    & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                                                 : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)))) 
+           >> (0x00000018U & (((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_A)
+                                : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)) 
+                              << 3U)));
+    tb__DOT__user_project__DOT__result = (0x000000ffU 
+                                          & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data) 
+                                             - ((0U 
+                                                 == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                 ? tb__DOT__user_project__DOT__mem__DOT__rb_data_actual
+                                                 : 
+                                                ((1U 
+                                                  == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                  ? 
+                                                 (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                  >> 8U)
+                                                  : 
+                                                 ((2U 
+                                                   == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                   ? 
+                                                  (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000010U)
+                                                   : 
+                                                  (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000018U))))));
+    if (((((((((0U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                             >> 5U))) | (1U == (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))) 
+              | (2U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                              >> 5U)))) | (3U == (7U 
+                                                  & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                     >> 5U)))) 
+            | (4U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                            >> 5U)))) | (5U == (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))) 
+          | (6U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                          >> 5U)))) | (7U == (7U & 
+                                              ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                               >> 5U))))) {
+        vlSelfRef.tb__DOT__uo_out = (0x000000ffU & 
+                                     ((0U == (7U & 
+                                              ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                               >> 5U)))
+                                       ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prog_uo_out)
+                                       : ((1U == (7U 
+                                                  & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                     >> 5U)))
+                                           ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)
+                                           : ((2U == 
+                                               (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))
+                                               ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data)
+                                               : ((3U 
+                                                   == 
+                                                   (7U 
+                                                    & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                       >> 5U)))
+                                                   ? (IData)(
+                                                             (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                              >> 8U))
+                                                   : 
+                                                  ((4U 
+                                                    == 
+                                                    (7U 
+                                                     & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                        >> 5U)))
+                                                    ? (IData)(
+                                                              (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                               >> 0x00000010U))
+                                                    : 
+                                                   ((5U 
+                                                     == 
+                                                     (7U 
+                                                      & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                         >> 5U)))
+                                                     ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data)
+                                                     : 
+                                                    ((6U 
+                                                      == 
+                                                      (7U 
+                                                       & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                          >> 5U)))
+                                                      ? (IData)(tb__DOT__user_project__DOT__result)
+                                                      : (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)))))))));
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__next_PC = 
+        (0x000000ffU & ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                         ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)
+                         : ((IData)((((IData)(tb__DOT__user_project__DOT__result) 
+                                      >> 7U) | (0U 
+                                                == (IData)(tb__DOT__user_project__DOT__result))))
+                             ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__reg_C)
+                             : ((IData)(3U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)))));
+    if ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte 
+            = vlSelfRef.tb__DOT__ui_in;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & ((IData)(4U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & ((8U & (IData)(vlSelfRef.tb__DOT__uio_in))
+                               ? ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC))
+                               : ((4U & (IData)(vlSelfRef.tb__DOT__uio_in))
+                                   ? (IData)(vlSelfRef.tb__DOT__ui_in)
+                                   : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC))));
+    } else if ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & (IData)((vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                      >> 8U)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data));
+    } else if ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte 
+            = tb__DOT__user_project__DOT__result;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & ((IData)(4U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC));
+    } else {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & 0U);
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & 0U);
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data 
+        = ((2U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+            ? ((1U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+                ? (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                    << 0x00000018U) | (0x00ffffffU 
+                                       & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                : ((0xff000000U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                       << 0x00000010U) | (0x0000ffffU 
+                                          & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))))
+            : ((1U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+                ? ((0xffff0000U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                       << 8U) | (0x000000ffU & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)))
+                : ((0xffffff00U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte))));
+}
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __Vtrigprevexpr_h3d519a83__0;
+    __Vtrigprevexpr_h3d519a83__0 = 0;
+    // Body
+    __Vtrigprevexpr_h3d519a83__0 = (1U & ((~ (IData)(vlSelfRef.tb__DOT__user_project__DOT__out_strobe)) 
+                                          & ((IData)(vlSelfRef.tb__DOT__uio_oe) 
+                                             >> 4U)));
+    vlSelfRef.__VactTriggered[0U] = (QData)((IData)(
+                                                    (((vlSelfRef.__VdlySched.awaitingCurrentTime() 
+                                                       << 3U) 
+                                                      | (((IData)(vlSelfRef.tb__DOT__clk) 
+                                                          & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0))) 
+                                                         << 2U)) 
+                                                     | ((((IData)(__Vtrigprevexpr_h3d519a83__0) 
+                                                          & (~ (IData)(vlSelfRef.__Vtrigprevexpr_h3d519a83__1))) 
+                                                         << 1U) 
+                                                        | ((~ (IData)(vlSelfRef.tb__DOT__rst_n)) 
+                                                           & (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__rst_n__0))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__rst_n__0 
+        = vlSelfRef.tb__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr_h3d519a83__1 = __Vtrigprevexpr_h3d519a83__0;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0 
+        = vlSelfRef.tb__DOT__clk;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___nba_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__rst_n) {
+        if ((0U != (IData)(vlSelfRef.tb__DOT__uo_out))) {
+            if ((0x0100U > (IData)(vlSelfRef.tb__DOT__out_fifo_count))) {
+                VL_ASSIGNSEL_WI(2048, 8, (0x000007f8U 
+                                          & ((IData)(vlSelfRef.tb__DOT__out_fifo_count) 
+                                             << 3U)), vlSelfRef.tb__DOT__out_fifo, vlSelfRef.tb__DOT__uo_out);
+            }
+            vlSelfRef.tb__DOT__out_fifo_count = (0x0000ffffU 
+                                                 & ((IData)(1U) 
+                                                    + (IData)(vlSelfRef.tb__DOT__out_fifo_count)));
+        }
+    } else {
+        vlSelfRef.tb__DOT__out_fifo_count = 0U;
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*7:0*/ tb__DOT__user_project__DOT__result;
+    tb__DOT__user_project__DOT__result = 0;
+    CData/*0:0*/ tb__DOT__user_project__DOT__wr_en;
+    tb__DOT__user_project__DOT__wr_en = 0;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__rb_data_actual;
+    tb__DOT__user_project__DOT__mem__DOT__rb_data_actual = 0;
+    CData/*7:0*/ __Vdly__tb__DOT__user_project__DOT__PC;
+    __Vdly__tb__DOT__user_project__DOT__PC = 0;
+    CData/*2:0*/ __Vdly__tb__DOT__user_project__DOT__state;
+    __Vdly__tb__DOT__user_project__DOT__state = 0;
+    IData/*31:0*/ __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0;
+    __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 = 0;
+    CData/*4:0*/ __VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0;
+    __VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 = 0;
+    CData/*0:0*/ __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0;
+    __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 = 0;
+    IData/*31:0*/ __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0;
+    __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 = 0;
+    CData/*4:0*/ __VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0;
+    __VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 = 0;
+    CData/*0:0*/ __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0;
+    __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 = 0;
+    // Body
+    __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 = 0U;
+    __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 = 0U;
+    __Vdly__tb__DOT__user_project__DOT__PC = vlSelfRef.tb__DOT__user_project__DOT__PC;
+    __Vdly__tb__DOT__user_project__DOT__state = vlSelfRef.tb__DOT__user_project__DOT__state;
+    if (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena) {
+        __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 
+            = vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data;
+        __VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 
+            = (0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                              >> 2U));
+        __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0 = 1U;
+    }
+    if (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena) {
+        __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 
+            = vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data;
+        __VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 
+            = (0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                              >> 2U));
+        __VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0 = 1U;
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__out_strobe 
+        = ((IData)(vlSelfRef.tb__DOT__rst_n) && (0xfeU 
+                                                 == (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr)));
+    if (vlSelfRef.tb__DOT__rst_n) {
+        if ((0xfeU == (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))) {
+            vlSelfRef.tb__DOT__user_project__DOT__prog_uo_out 
+                = vlSelfRef.tb__DOT__user_project__DOT__wr_byte;
+        }
+        vlSelfRef.tb__DOT__user_project__DOT__prev_B_low 
+            = (3U & (IData)((vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                             >> 8U)));
+        vlSelfRef.tb__DOT__user_project__DOT__prev_A 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data));
+        vlSelfRef.tb__DOT__user_project__DOT__reg_C 
+            = (0x000000ffU & (IData)((vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                      >> 0x00000010U)));
+        if ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+            if ((8U & (IData)(vlSelfRef.tb__DOT__uio_in))) {
+                __Vdly__tb__DOT__user_project__DOT__PC 
+                    = (0x000000ffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)));
+            }
+            if ((4U & (IData)(vlSelfRef.tb__DOT__uio_in))) {
+                __Vdly__tb__DOT__user_project__DOT__PC 
+                    = vlSelfRef.tb__DOT__ui_in;
+            }
+            if ((((IData)(vlSelfRef.tb__DOT__uio_in) 
+                  & (~ (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_run))) 
+                 & (0xfcU >= (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)))) {
+                __Vdly__tb__DOT__user_project__DOT__state = 1U;
+            }
+        } else if ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+            __Vdly__tb__DOT__user_project__DOT__state = 2U;
+            vlSelfRef.tb__DOT__user_project__DOT__reg_C 
+                = (0x000000ffU & (IData)((vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                          >> 0x00000010U)));
+        } else if ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+            if ((1U & ((~ (IData)(vlSelfRef.tb__DOT__uio_in)) 
+                       | (0xfcU < (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC))))) {
+                __Vdly__tb__DOT__user_project__DOT__state = 0U;
+            } else {
+                __Vdly__tb__DOT__user_project__DOT__PC 
+                    = vlSelfRef.tb__DOT__user_project__DOT__next_PC;
+                __Vdly__tb__DOT__user_project__DOT__state = 1U;
+            }
+        } else {
+            __Vdly__tb__DOT__user_project__DOT__state = 0U;
+        }
+    } else {
+        vlSelfRef.tb__DOT__user_project__DOT__prog_uo_out = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__prev_B_low = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__prev_A = 0U;
+        __Vdly__tb__DOT__user_project__DOT__state = 0U;
+        __Vdly__tb__DOT__user_project__DOT__PC = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__reg_C = 0U;
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_special 
+        = ((IData)(vlSelfRef.tb__DOT__rst_n) && (0x3fU 
+                                                 == 
+                                                 (0x0000003fU 
+                                                  & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                                                     >> 2U))));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_a 
+        = ((IData)(vlSelfRef.tb__DOT__rst_n) && (1U 
+                                                 & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                                                    >> 7U)));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_special 
+        = ((IData)(vlSelfRef.tb__DOT__rst_n) && (0x3fU 
+                                                 == 
+                                                 (0x0000003fU 
+                                                  & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                                                     >> 2U))));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_b 
+        = ((IData)(vlSelfRef.tb__DOT__rst_n) && (1U 
+                                                 & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                                                    >> 7U)));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_ra_data 
+        = (((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena) 
+            & ((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                               >> 2U)) == (0x0000001fU 
+                                           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                                              >> 2U))))
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage
+           [(0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                            >> 2U))]);
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_rb_data 
+        = (((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena) 
+            & ((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                               >> 2U)) == (0x0000001fU 
+                                           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                                              >> 2U))))
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage
+           [(0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                            >> 2U))]);
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_ra_data 
+        = (((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena) 
+            & ((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                               >> 2U)) == (0x0000001fU 
+                                           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                                              >> 2U))))
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage
+           [(0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                            >> 2U))]);
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_rb_data 
+        = (((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena) 
+            & ((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                               >> 2U)) == (0x0000001fU 
+                                           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                                              >> 2U))))
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage
+           [(0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                            >> 2U))]);
+    if (__VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0) {
+        vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[__VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0] 
+            = __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage__v0;
+    }
+    if (__VdlySet__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0) {
+        vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[__VdlyDim0__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0] 
+            = __VdlyVal__tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage__v0;
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__PC = __Vdly__tb__DOT__user_project__DOT__PC;
+    vlSelfRef.tb__DOT__user_project__DOT__state = __Vdly__tb__DOT__user_project__DOT__state;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_a)
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_ra_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_ra_data);
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_b)
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_rb_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_rb_data);
+    vlSelfRef.tb__DOT__user_project__DOT__prev_run 
+        = ((IData)(vlSelfRef.tb__DOT__rst_n) && (1U 
+                                                 & (IData)(vlSelfRef.tb__DOT__uio_in)));
+    vlSelfRef.tb__DOT__halted = (IData)((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)));
+    tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_special)
+            ? (((IData)(vlSelfRef.tb__DOT__ui_in) << 8U) 
+               | (0x000000ffU & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data))
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data);
+    if ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        tb__DOT__user_project__DOT__wr_en = (1U & (IData)(
+                                                          (8U 
+                                                           == 
+                                                           (9U 
+                                                            & (IData)(vlSelfRef.tb__DOT__uio_in)))));
+        vlSelfRef.tb__DOT__user_project__DOT__wr_addr 
+            = vlSelfRef.tb__DOT__user_project__DOT__PC;
+    } else {
+        tb__DOT__user_project__DOT__wr_en = (1U & (
+                                                   (1U 
+                                                    != (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)) 
+                                                   && (2U 
+                                                       == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))));
+        vlSelfRef.tb__DOT__user_project__DOT__wr_addr 
+            = ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                ? 0U : ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                         ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_A)
+                         : 0U));
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena 
+        = ((~ ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+               >> 7U)) & (IData)(tb__DOT__user_project__DOT__wr_en));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena 
+        = ((IData)(tb__DOT__user_project__DOT__wr_en) 
+           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+              >> 7U));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+        = ((((QData)((IData)(tb__DOT__user_project__DOT__mem__DOT__rb_data_actual)) 
+             << 0x00000020U) | (QData)((IData)(((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_special)
+                                                 ? 
+                                                (((IData)(vlSelfRef.tb__DOT__ui_in) 
+                                                  << 8U) 
+                                                 | (0x000000ffU 
+                                                    & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                                                 : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)))) 
+           >> (0x00000018U & (((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_A)
+                                : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)) 
+                              << 3U)));
+    tb__DOT__user_project__DOT__result = (0x000000ffU 
+                                          & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data) 
+                                             - ((0U 
+                                                 == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                 ? tb__DOT__user_project__DOT__mem__DOT__rb_data_actual
+                                                 : 
+                                                ((1U 
+                                                  == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                  ? 
+                                                 (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                  >> 8U)
+                                                  : 
+                                                 ((2U 
+                                                   == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                   ? 
+                                                  (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000010U)
+                                                   : 
+                                                  (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000018U))))));
+    if (((((((((0U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                             >> 5U))) | (1U == (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))) 
+              | (2U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                              >> 5U)))) | (3U == (7U 
+                                                  & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                     >> 5U)))) 
+            | (4U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                            >> 5U)))) | (5U == (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))) 
+          | (6U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                          >> 5U)))) | (7U == (7U & 
+                                              ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                               >> 5U))))) {
+        vlSelfRef.tb__DOT__uo_out = (0x000000ffU & 
+                                     ((0U == (7U & 
+                                              ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                               >> 5U)))
+                                       ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prog_uo_out)
+                                       : ((1U == (7U 
+                                                  & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                     >> 5U)))
+                                           ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)
+                                           : ((2U == 
+                                               (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))
+                                               ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data)
+                                               : ((3U 
+                                                   == 
+                                                   (7U 
+                                                    & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                       >> 5U)))
+                                                   ? (IData)(
+                                                             (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                              >> 8U))
+                                                   : 
+                                                  ((4U 
+                                                    == 
+                                                    (7U 
+                                                     & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                        >> 5U)))
+                                                    ? (IData)(
+                                                              (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                               >> 0x00000010U))
+                                                    : 
+                                                   ((5U 
+                                                     == 
+                                                     (7U 
+                                                      & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                         >> 5U)))
+                                                     ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data)
+                                                     : 
+                                                    ((6U 
+                                                      == 
+                                                      (7U 
+                                                       & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                          >> 5U)))
+                                                      ? (IData)(tb__DOT__user_project__DOT__result)
+                                                      : (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)))))))));
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__next_PC = 
+        (0x000000ffU & ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                         ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)
+                         : ((IData)((((IData)(tb__DOT__user_project__DOT__result) 
+                                      >> 7U) | (0U 
+                                                == (IData)(tb__DOT__user_project__DOT__result))))
+                             ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__reg_C)
+                             : ((IData)(3U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)))));
+    if ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte 
+            = vlSelfRef.tb__DOT__ui_in;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & ((IData)(4U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & ((8U & (IData)(vlSelfRef.tb__DOT__uio_in))
+                               ? ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC))
+                               : ((4U & (IData)(vlSelfRef.tb__DOT__uio_in))
+                                   ? (IData)(vlSelfRef.tb__DOT__ui_in)
+                                   : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC))));
+    } else if ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & (IData)((vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                      >> 8U)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data));
+    } else if ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte 
+            = tb__DOT__user_project__DOT__result;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & ((IData)(4U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC));
+    } else {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & 0U);
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & 0U);
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data 
+        = ((2U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+            ? ((1U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+                ? (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                    << 0x00000018U) | (0x00ffffffU 
+                                       & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                : ((0xff000000U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                       << 0x00000010U) | (0x0000ffffU 
+                                          & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))))
+            : ((1U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+                ? ((0xffff0000U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                       << 8U) | (0x000000ffU & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)))
+                : ((0xffffff00U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte))));
+}
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__rst_n) {
+            if ((0U != (IData)(vlSelfRef.tb__DOT__uo_out))) {
+                if ((0x0100U > (IData)(vlSelfRef.tb__DOT__out_fifo_count))) {
+                    VL_ASSIGNSEL_WI(2048, 8, (0x000007f8U 
+                                              & ((IData)(vlSelfRef.tb__DOT__out_fifo_count) 
+                                                 << 3U)), vlSelfRef.tb__DOT__out_fifo, vlSelfRef.tb__DOT__uo_out);
+                }
+                vlSelfRef.tb__DOT__out_fifo_count = 
+                    (0x0000ffffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__out_fifo_count)));
+            }
+        } else {
+            vlSelfRef.tb__DOT__out_fifo_count = 0U;
+        }
+    }
+    if ((4ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__1(vlSelf);
+    }
+}
+
+void Vtop___024root___timing_resume(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___timing_resume\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((8ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__VdlySched.resume();
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_vec(VlUnpacked<QData/*63:0*/, 1> &out, const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((0U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VactExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VactTriggered, vlSelfRef.__VactTriggeredAcc);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    __VactExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VactTriggered);
+    if (__VactExecute) {
+        vlSelfRef.__VactTriggeredAcc.fill(0ULL);
+        Vtop___024root___timing_resume(vlSelf);
+    }
+    return (__VactExecute);
+}
+
+bool Vtop___024root___eval_phase__inact(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__inact\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VinactExecute;
+    // Body
+    __VinactExecute = vlSelfRef.__VdlySched.awaitingZeroDelay();
+    if (__VinactExecute) {
+        VL_FATAL_MT("/root/package/test/tb.v", 12, "", "ZERODLY: Design Verilated with '--no-sched-zero-delay', but #0 delay executed at runtime");
+    }
+    return (__VinactExecute);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 1> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/test/tb.v", 12, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/test/tb.v", 12, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VinactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VinactIterCount)))) {
+                VL_FATAL_MT("/root/package/test/tb.v", 12, "", "DIDNOTCONVERGE: Inactive region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VinactIterCount = ((IData)(1U) 
+                                           + vlSelfRef.__VinactIterCount);
+            vlSelfRef.__VactIterCount = 0U;
+            do {
+                if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                    Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                    VL_FATAL_MT("/root/package/test/tb.v", 12, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+                }
+                vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                             + vlSelfRef.__VactIterCount);
+                vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+            } while (vlSelfRef.__VactPhaseResult);
+            vlSelfRef.__VinactPhaseResult = Vtop___024root___eval_phase__inact(vlSelf);
+        } while (vlSelfRef.__VinactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+#endif  // VL_DEBUG
@@ -0,0 +1,516 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__rst_n__0 
+        = vlSelfRef.tb__DOT__rst_n;
+    vlSelfRef.__Vtrigprevexpr_h3d519a83__1 = (1U & 
+                                              ((~ (IData)(vlSelfRef.tb__DOT__user_project__DOT__out_strobe)) 
+                                               & ((IData)(vlSelfRef.tb__DOT__uio_oe) 
+                                                  >> 4U)));
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0 
+        = vlSelfRef.tb__DOT__clk;
+    do {
+        vlSelfRef.__VactTriggeredAcc[vlSelfRef.__Vi] 
+            = vlSelfRef.__VactTriggered[vlSelfRef.__Vi];
+        vlSelfRef.__Vi = ((IData)(1U) + vlSelfRef.__Vi);
+    } while ((0U >= vlSelfRef.__Vi));
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__clk = 0U;
+    vlSelfRef.tb__DOT__uio_oe = 0x12U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[0U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[1U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[2U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[3U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[4U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[5U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[6U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[7U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[8U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[9U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[10U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[11U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[12U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[13U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[14U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[15U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[16U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[17U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[18U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[19U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[20U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[21U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[22U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[23U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[24U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[25U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[26U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[27U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[28U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[29U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[30U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[31U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[0U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[1U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[2U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[3U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[4U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[5U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[6U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[7U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[8U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[9U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[10U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[11U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[12U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[13U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[14U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[15U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[16U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[17U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[18U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[19U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[20U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[21U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[22U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[23U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[24U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[25U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[26U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[27U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[28U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[29U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[30U] = 0U;
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[31U] = 0U;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/test/tb.v", 12, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+VL_ATTR_COLD void Vtop___024root___stl_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___stl_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*7:0*/ tb__DOT__user_project__DOT__result;
+    tb__DOT__user_project__DOT__result = 0;
+    CData/*0:0*/ tb__DOT__user_project__DOT__wr_en;
+    tb__DOT__user_project__DOT__wr_en = 0;
+    IData/*31:0*/ tb__DOT__user_project__DOT__mem__DOT__rb_data_actual;
+    tb__DOT__user_project__DOT__mem__DOT__rb_data_actual = 0;
+    // Body
+    vlSelfRef.tb__DOT__halted = (IData)((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_a)
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_ra_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_ra_data);
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_b)
+            ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_rb_data
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_rb_data);
+    if ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        tb__DOT__user_project__DOT__wr_en = (1U & (IData)(
+                                                          (8U 
+                                                           == 
+                                                           (9U 
+                                                            & (IData)(vlSelfRef.tb__DOT__uio_in)))));
+        vlSelfRef.tb__DOT__user_project__DOT__wr_addr 
+            = vlSelfRef.tb__DOT__user_project__DOT__PC;
+    } else {
+        tb__DOT__user_project__DOT__wr_en = (1U & (
+                                                   (1U 
+                                                    != (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)) 
+                                                   && (2U 
+                                                       == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))));
+        vlSelfRef.tb__DOT__user_project__DOT__wr_addr 
+            = ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                ? 0U : ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                         ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_A)
+                         : 0U));
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena 
+        = ((~ ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+               >> 7U)) & (IData)(tb__DOT__user_project__DOT__wr_en));
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena 
+        = ((IData)(tb__DOT__user_project__DOT__wr_en) 
+           & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+              >> 7U));
+    tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+        = ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_special)
+            ? (((IData)(vlSelfRef.tb__DOT__ui_in) << 8U) 
+               | (0x000000ffU & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data))
+            : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data);
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+        = ((((QData)((IData)(tb__DOT__user_project__DOT__mem__DOT__rb_data_actual)) 
+             << 0x00000020U) | (QData)((IData)(((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_special)
+                                                 ? 
+                                                (((IData)(vlSelfRef.tb__DOT__ui_in) 
+                                                  << 8U) 
+                                                 | (0x000000ffU 
+                                                    & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                                                 : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)))) 
+           >> (0x00000018U & (((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_A)
+                                : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)) 
+                              << 3U)));
+    tb__DOT__user_project__DOT__result = (0x000000ffU 
+                                          & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data) 
+                                             - ((0U 
+                                                 == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                 ? tb__DOT__user_project__DOT__mem__DOT__rb_data_actual
+                                                 : 
+                                                ((1U 
+                                                  == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                  ? 
+                                                 (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                  >> 8U)
+                                                  : 
+                                                 ((2U 
+                                                   == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                   ? 
+                                                  (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000010U)
+                                                   : 
+                                                  (tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000018U))))));
+    if (((((((((0U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                             >> 5U))) | (1U == (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))) 
+              | (2U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                              >> 5U)))) | (3U == (7U 
+                                                  & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                     >> 5U)))) 
+            | (4U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                            >> 5U)))) | (5U == (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))) 
+          | (6U == (7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                          >> 5U)))) | (7U == (7U & 
+                                              ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                               >> 5U))))) {
+        vlSelfRef.tb__DOT__uo_out = (0x000000ffU & 
+                                     ((0U == (7U & 
+                                              ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                               >> 5U)))
+                                       ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prog_uo_out)
+                                       : ((1U == (7U 
+                                                  & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                     >> 5U)))
+                                           ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)
+                                           : ((2U == 
+                                               (7U 
+                                                & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                   >> 5U)))
+                                               ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data)
+                                               : ((3U 
+                                                   == 
+                                                   (7U 
+                                                    & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                       >> 5U)))
+                                                   ? (IData)(
+                                                             (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                              >> 8U))
+                                                   : 
+                                                  ((4U 
+                                                    == 
+                                                    (7U 
+                                                     & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                        >> 5U)))
+                                                    ? (IData)(
+                                                              (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                               >> 0x00000010U))
+                                                    : 
+                                                   ((5U 
+                                                     == 
+                                                     (7U 
+                                                      & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                         >> 5U)))
+                                                     ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data)
+                                                     : 
+                                                    ((6U 
+                                                      == 
+                                                      (7U 
+                                                       & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                                          >> 5U)))
+                                                      ? (IData)(tb__DOT__user_project__DOT__result)
+                                                      : (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)))))))));
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__next_PC = 
+        (0x000000ffU & ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                         ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)
+                         : ((IData)((((IData)(tb__DOT__user_project__DOT__result) 
+                                      >> 7U) | (0U 
+                                                == (IData)(tb__DOT__user_project__DOT__result))))
+                             ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__reg_C)
+                             : ((IData)(3U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)))));
+    if ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte 
+            = vlSelfRef.tb__DOT__ui_in;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & ((IData)(4U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & ((8U & (IData)(vlSelfRef.tb__DOT__uio_in))
+                               ? ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC))
+                               : ((4U & (IData)(vlSelfRef.tb__DOT__uio_in))
+                                   ? (IData)(vlSelfRef.tb__DOT__ui_in)
+                                   : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC))));
+    } else if ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & (IData)((vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                      >> 8U)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data));
+    } else if ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))) {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte 
+            = tb__DOT__user_project__DOT__result;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & ((IData)(4U) + (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC)));
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__next_PC));
+    } else {
+        vlSelfRef.tb__DOT__user_project__DOT__wr_byte = 0U;
+        vlSelfRef.tb__DOT__user_project__DOT__rb_addr 
+            = (0x000000ffU & 0U);
+        vlSelfRef.tb__DOT__user_project__DOT__ra_addr 
+            = (0x000000ffU & 0U);
+    }
+    vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data 
+        = ((2U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+            ? ((1U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+                ? (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                    << 0x00000018U) | (0x00ffffffU 
+                                       & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                : ((0xff000000U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                       << 0x00000010U) | (0x0000ffffU 
+                                          & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))))
+            : ((1U & (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr))
+                ? ((0xffff0000U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte) 
+                       << 8U) | (0x000000ffU & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)))
+                : ((0xffffff00U & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data) 
+                   | (IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_byte))));
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___stl_sequent__TOP__0(vlSelf);
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(negedge tb.rst_n)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(posedge ((~ tb.user_project.out_strobe) & tb.uio_oe[4]))\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge tb.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @([true] __VdlySched.awaitingCurrentTime())\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelf->tb__DOT__clk = 0;
+    vlSelf->tb__DOT__rst_n = 0;
+    vlSelf->tb__DOT__ena = 0;
+    vlSelf->tb__DOT__ui_in = 0;
+    vlSelf->tb__DOT__uio_in = 0;
+    vlSelf->tb__DOT__uo_out = 0;
+    vlSelf->tb__DOT__uio_oe = 0;
+    vlSelf->tb__DOT__halted = 0;
+    VL_ZERO_RESET_W(2048, vlSelf->tb__DOT__out_fifo);
+    vlSelf->tb__DOT__out_fifo_count = 0;
+    vlSelf->tb__DOT__user_project__DOT__state = 0;
+    vlSelf->tb__DOT__user_project__DOT__PC = 0;
+    vlSelf->tb__DOT__user_project__DOT__prog_uo_out = 0;
+    vlSelf->tb__DOT__user_project__DOT__prev_run = 0;
+    vlSelf->tb__DOT__user_project__DOT__prev_A = 0;
+    vlSelf->tb__DOT__user_project__DOT__prev_B_low = 0;
+    vlSelf->tb__DOT__user_project__DOT__reg_C = 0;
+    vlSelf->tb__DOT__user_project__DOT__next_PC = 0;
+    vlSelf->tb__DOT__user_project__DOT__wr_addr = 0;
+    vlSelf->tb__DOT__user_project__DOT__wr_byte = 0;
+    vlSelf->tb__DOT__user_project__DOT__ra_addr = 0;
+    vlSelf->tb__DOT__user_project__DOT__rb_addr = 0;
+    vlSelf->tb__DOT__user_project__DOT__out_strobe = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__ra_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__rb_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__w_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__ra_special = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__rb_special = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__inst_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_ra_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_rb_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_ra_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_rb_data = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_a = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_b = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_low__w_ena = 0;
+    vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT____Vcellinp__mem_high__w_ena = 0;
+    for (int __Vi0 = 0; __Vi0 < 32; ++__Vi0) {
+        vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 32; ++__Vi0) {
+        vlSelf->tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggeredAcc[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__rst_n__0 = 0;
+    vlSelf->__Vtrigprevexpr_h3d519a83__1 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__clk__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vi = 0;
+}
@@ -0,0 +1,71 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(346);
+    // Setup sub module instances
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-6);
+    _vm_contextp__->timeprecision(-9);
+    // Setup each module's pointers to their submodules
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_tb = new VerilatedScope{this, "tb", "tb", "tb", -6, VerilatedScope::SCOPE_MODULE};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_tb);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_tb->varInsert("clk", &(TOP.tb__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("ena", &(TOP.tb__DOT__ena), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("halted", &(TOP.tb__DOT__halted), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb->varInsert("out_fifo", &(TOP.tb__DOT__out_fifo), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,2047,0);
+    __Vscopep_tb->varInsert("out_fifo_count", &(TOP.tb__DOT__out_fifo_count), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_tb->varInsert("rst_n", &(TOP.tb__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("ui_in", &(TOP.tb__DOT__ui_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_tb->varInsert("uio_in", &(TOP.tb__DOT__uio_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb->varInsert("uo_out", &(TOP.tb__DOT__uo_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_tb);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    if (__Vm_dumping) _traceDumpClose();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_tb, __Vscopep_tb = nullptr);
+    // Tear down sub module instances
+}
+
+void Vtop__Syms::_traceDump() {
+    const VerilatedLockGuard lock{__Vm_dumperMutex};
+    __Vm_dumperp->dump(VL_TIME_Q());
+}
+
+void Vtop__Syms::_traceDumpOpen() {
+    const VerilatedLockGuard lock{__Vm_dumperMutex};
+    if (VL_UNLIKELY(!__Vm_dumperp)) {
+        __Vm_dumperp = new VerilatedVcdC();
+        __Vm_modelp->trace(__Vm_dumperp, 0, 0);
+        const std::string dumpfile = _vm_contextp__->dumpfileCheck();
+        __Vm_dumperp->open(dumpfile.c_str());
+        __Vm_dumping = true;
+    }
+}
+
+void Vtop__Syms::_traceDumpClose() {
+    const VerilatedLockGuard lock{__Vm_dumperMutex};
+    __Vm_dumping = false;
+    VL_DO_CLEAR(delete __Vm_dumperp, __Vm_dumperp = nullptr);
+}
@@ -0,0 +1,217 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Tracing implementation internals
+
+#include "verilated_vcd_c.h"
+#include "Vtop__Syms.h"
+
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp);
+
+void Vtop___024root__trace_chg_0(void* voidSelf, VerilatedVcd::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    if (VL_UNLIKELY(!vlSymsp->__Vm_activity)) return;
+    Vtop___024root__trace_chg_0_sub_0((&vlSymsp->TOP), bufp);
+}
+
+void Vtop___024root__trace_chg_0_sub_0(Vtop___024root* vlSelf, VerilatedVcd::Buffer* bufp) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_chg_0_sub_0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    uint32_t* const oldp VL_ATTR_UNUSED = bufp->oldp(vlSymsp->__Vm_baseCode + 0);
+    if (VL_UNLIKELY(((vlSelfRef.__Vm_traceActivity[1U] 
+                      | vlSelfRef.__Vm_traceActivity[3U])))) {
+        bufp->chgIData(oldp+0,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[0]),32);
+        bufp->chgIData(oldp+1,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[1]),32);
+        bufp->chgIData(oldp+2,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[2]),32);
+        bufp->chgIData(oldp+3,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[3]),32);
+        bufp->chgIData(oldp+4,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[4]),32);
+        bufp->chgIData(oldp+5,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[5]),32);
+        bufp->chgIData(oldp+6,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[6]),32);
+        bufp->chgIData(oldp+7,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[7]),32);
+        bufp->chgIData(oldp+8,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[8]),32);
+        bufp->chgIData(oldp+9,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[9]),32);
+        bufp->chgIData(oldp+10,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[10]),32);
+        bufp->chgIData(oldp+11,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[11]),32);
+        bufp->chgIData(oldp+12,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[12]),32);
+        bufp->chgIData(oldp+13,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[13]),32);
+        bufp->chgIData(oldp+14,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[14]),32);
+        bufp->chgIData(oldp+15,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[15]),32);
+        bufp->chgIData(oldp+16,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[16]),32);
+        bufp->chgIData(oldp+17,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[17]),32);
+        bufp->chgIData(oldp+18,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[18]),32);
+        bufp->chgIData(oldp+19,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[19]),32);
+        bufp->chgIData(oldp+20,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[20]),32);
+        bufp->chgIData(oldp+21,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[21]),32);
+        bufp->chgIData(oldp+22,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[22]),32);
+        bufp->chgIData(oldp+23,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[23]),32);
+        bufp->chgIData(oldp+24,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[24]),32);
+        bufp->chgIData(oldp+25,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[25]),32);
+        bufp->chgIData(oldp+26,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[26]),32);
+        bufp->chgIData(oldp+27,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[27]),32);
+        bufp->chgIData(oldp+28,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[28]),32);
+        bufp->chgIData(oldp+29,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[29]),32);
+        bufp->chgIData(oldp+30,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[30]),32);
+        bufp->chgIData(oldp+31,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__storage[31]),32);
+        bufp->chgIData(oldp+32,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[0]),32);
+        bufp->chgIData(oldp+33,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[1]),32);
+        bufp->chgIData(oldp+34,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[2]),32);
+        bufp->chgIData(oldp+35,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[3]),32);
+        bufp->chgIData(oldp+36,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[4]),32);
+        bufp->chgIData(oldp+37,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[5]),32);
+        bufp->chgIData(oldp+38,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[6]),32);
+        bufp->chgIData(oldp+39,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[7]),32);
+        bufp->chgIData(oldp+40,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[8]),32);
+        bufp->chgIData(oldp+41,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[9]),32);
+        bufp->chgIData(oldp+42,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[10]),32);
+        bufp->chgIData(oldp+43,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[11]),32);
+        bufp->chgIData(oldp+44,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[12]),32);
+        bufp->chgIData(oldp+45,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[13]),32);
+        bufp->chgIData(oldp+46,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[14]),32);
+        bufp->chgIData(oldp+47,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[15]),32);
+        bufp->chgIData(oldp+48,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[16]),32);
+        bufp->chgIData(oldp+49,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[17]),32);
+        bufp->chgIData(oldp+50,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[18]),32);
+        bufp->chgIData(oldp+51,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[19]),32);
+        bufp->chgIData(oldp+52,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[20]),32);
+        bufp->chgIData(oldp+53,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[21]),32);
+        bufp->chgIData(oldp+54,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[22]),32);
+        bufp->chgIData(oldp+55,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[23]),32);
+        bufp->chgIData(oldp+56,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[24]),32);
+        bufp->chgIData(oldp+57,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[25]),32);
+        bufp->chgIData(oldp+58,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[26]),32);
+        bufp->chgIData(oldp+59,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[27]),32);
+        bufp->chgIData(oldp+60,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[28]),32);
+        bufp->chgIData(oldp+61,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[29]),32);
+        bufp->chgIData(oldp+62,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[30]),32);
+        bufp->chgIData(oldp+63,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__storage[31]),32);
+    }
+    if (VL_UNLIKELY(((vlSelfRef.__Vm_traceActivity[2U] 
+                      | vlSelfRef.__Vm_traceActivity[3U])))) {
+        bufp->chgCData(oldp+64,((0x000000ffU & (IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data))),8);
+        bufp->chgCData(oldp+65,((0x000000ffU & (IData)(
+                                                       (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                        >> 8U)))),8);
+        bufp->chgCData(oldp+66,((0x000000ffU & (IData)(
+                                                       (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data 
+                                                        >> 0x00000010U)))),8);
+        bufp->chgCData(oldp+67,((0x000000ffU & ((0U 
+                                                 == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                 ? vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data_actual
+                                                 : 
+                                                ((1U 
+                                                  == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                  ? 
+                                                 (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                  >> 8U)
+                                                  : 
+                                                 ((2U 
+                                                   == (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low))
+                                                   ? 
+                                                  (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000010U)
+                                                   : 
+                                                  (vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data_actual 
+                                                   >> 0x00000018U)))))),8);
+        bufp->chgCData(oldp+68,(vlSelfRef.tb__DOT__user_project__DOT__result),8);
+        bufp->chgBit(oldp+69,((IData)((((IData)(vlSelfRef.tb__DOT__user_project__DOT__result) 
+                                        >> 7U) | (0U 
+                                                  == (IData)(vlSelfRef.tb__DOT__user_project__DOT__result))))));
+        bufp->chgCData(oldp+70,(vlSelfRef.tb__DOT__user_project__DOT__next_PC),8);
+        bufp->chgBit(oldp+71,(vlSelfRef.tb__DOT__user_project__DOT__wr_en));
+        bufp->chgCData(oldp+72,(vlSelfRef.tb__DOT__user_project__DOT__wr_byte),8);
+        bufp->chgCData(oldp+73,(vlSelfRef.tb__DOT__user_project__DOT__ra_addr),8);
+        bufp->chgCData(oldp+74,(vlSelfRef.tb__DOT__user_project__DOT__rb_addr),8);
+        bufp->chgCData(oldp+75,((0x0000003fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                                                >> 2U))),6);
+        bufp->chgCData(oldp+76,((0x0000003fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                                                >> 2U))),6);
+        bufp->chgIData(oldp+77,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__w_data),32);
+        bufp->chgIData(oldp+78,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data_actual),32);
+        bufp->chgQData(oldp+79,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__inst_data),64);
+        bufp->chgBit(oldp+81,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__w_ena));
+        bufp->chgCData(oldp+82,((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__ra_addr) 
+                                                >> 2U))),5);
+        bufp->chgCData(oldp+83,((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__rb_addr) 
+                                                >> 2U))),5);
+        bufp->chgBit(oldp+84,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__w_ena));
+    }
+    if (VL_UNLIKELY((vlSelfRef.__Vm_traceActivity[3U]))) {
+        bufp->chgCData(oldp+85,((((IData)(vlSelfRef.tb__DOT__user_project__DOT__out_strobe) 
+                                  << 4U) | ((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state)) 
+                                            << 1U))),8);
+        bufp->chgBit(oldp+86,((1U & (~ (IData)(vlSelfRef.tb__DOT__user_project__DOT__out_strobe)))));
+        bufp->chgCData(oldp+87,(vlSelfRef.tb__DOT__user_project__DOT__state),3);
+        bufp->chgCData(oldp+88,(vlSelfRef.tb__DOT__user_project__DOT__PC),8);
+        bufp->chgCData(oldp+89,(vlSelfRef.tb__DOT__user_project__DOT__prog_uo_out),8);
+        bufp->chgBit(oldp+90,(vlSelfRef.tb__DOT__user_project__DOT__prev_run));
+        bufp->chgCData(oldp+91,(vlSelfRef.tb__DOT__user_project__DOT__prev_A),8);
+        bufp->chgCData(oldp+92,(vlSelfRef.tb__DOT__user_project__DOT__prev_B_low),2);
+        bufp->chgCData(oldp+93,(vlSelfRef.tb__DOT__user_project__DOT__reg_C),8);
+        bufp->chgBit(oldp+94,((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))));
+        bufp->chgCData(oldp+95,(vlSelfRef.tb__DOT__user_project__DOT__wr_addr),8);
+        bufp->chgBit(oldp+96,(vlSelfRef.tb__DOT__user_project__DOT__out_strobe));
+        bufp->chgQData(oldp+97,(((0U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                  ? 0x0000000048616c74ULL
+                                  : ((1U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                      ? 0x00000052496e7374ULL
+                                      : ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                          ? 0x0000005244617461ULL
+                                          : 0x00496e76616c6964ULL)))),64);
+        bufp->chgCData(oldp+99,((3U & ((2U == (IData)(vlSelfRef.tb__DOT__user_project__DOT__state))
+                                        ? (IData)(vlSelfRef.tb__DOT__user_project__DOT__prev_A)
+                                        : (IData)(vlSelfRef.tb__DOT__user_project__DOT__PC)))),2);
+        bufp->chgIData(oldp+100,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data),32);
+        bufp->chgIData(oldp+101,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_data),32);
+        bufp->chgBit(oldp+102,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_special));
+        bufp->chgBit(oldp+103,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__rb_special));
+        bufp->chgCData(oldp+104,((0x0000003fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                                                 >> 2U))),6);
+        bufp->chgIData(oldp+105,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_ra_data),32);
+        bufp->chgIData(oldp+106,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low_rb_data),32);
+        bufp->chgIData(oldp+107,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_ra_data),32);
+        bufp->chgIData(oldp+108,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high_rb_data),32);
+        bufp->chgBit(oldp+109,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_a));
+        bufp->chgBit(oldp+110,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__bank_sel_b));
+        bufp->chgCData(oldp+111,((0x0000001fU & ((IData)(vlSelfRef.tb__DOT__user_project__DOT__wr_addr) 
+                                                 >> 2U))),5);
+    }
+    bufp->chgBit(oldp+112,(vlSelfRef.tb__DOT__clk));
+    bufp->chgBit(oldp+113,(vlSelfRef.tb__DOT__rst_n));
+    bufp->chgBit(oldp+114,(vlSelfRef.tb__DOT__ena));
+    bufp->chgCData(oldp+115,(vlSelfRef.tb__DOT__ui_in),8);
+    bufp->chgCData(oldp+116,(vlSelfRef.tb__DOT__uio_in),8);
+    bufp->chgCData(oldp+117,(vlSelfRef.tb__DOT__uo_out),8);
+    bufp->chgBit(oldp+118,(vlSelfRef.tb__DOT__halted));
+    bufp->chgWData(oldp+119,(vlSelfRef.tb__DOT__out_fifo),2048);
+    bufp->chgSData(oldp+183,(vlSelfRef.tb__DOT__out_fifo_count),16);
+    bufp->chgBit(oldp+184,((1U & (IData)(vlSelfRef.tb__DOT__uio_in))));
+    bufp->chgBit(oldp+185,((1U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                  >> 2U))));
+    bufp->chgBit(oldp+186,((1U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                  >> 3U))));
+    bufp->chgCData(oldp+187,((7U & ((IData)(vlSelfRef.tb__DOT__uio_in) 
+                                    >> 5U))),3);
+    bufp->chgIData(oldp+188,(((IData)(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_special)
+                               ? (((IData)(vlSelfRef.tb__DOT__ui_in) 
+                                   << 8U) | (0x000000ffU 
+                                             & vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data))
+                               : vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__ra_data)),32);
+    bufp->chgIData(oldp+189,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_high__DOT__unnamedblk1__DOT__i),32);
+    bufp->chgIData(oldp+190,(vlSelfRef.tb__DOT__user_project__DOT__mem__DOT__mem__DOT__mem_low__DOT__unnamedblk1__DOT__i),32);
+}
+
+void Vtop___024root__trace_cleanup(void* voidSelf, VerilatedVcd* /*unused*/) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root__trace_cleanup\n"); );
+    // Body
+    Vtop___024root* const __restrict vlSelf VL_ATTR_UNUSED = static_cast<Vtop___024root*>(voidSelf);
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    vlSymsp->__Vm_activity = false;
+    vlSymsp->TOP.__Vm_traceActivity[0U] = 0U;
+    vlSymsp->TOP.__Vm_traceActivity[1U] = 0U;
+    vlSymsp->TOP.__Vm_traceActivity[2U] = 0U;
+    vlSymsp->TOP.__Vm_traceActivity[3U] = 0U;
+}
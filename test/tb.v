@@ -1,20 +1,32 @@
 `default_nettype none
+// Gate level runs keep the original resolution, to match the nanosecond cell delays
+`ifdef GL_TEST
 `timescale 1ns / 1ps
+`else
+`timescale 1us / 1ns
+`endif
 
 /* This testbench just instantiates the module and makes some convenient wires
    that can be driven / tested by the cocotb test.py.
 */
 module tb ();
 
+`ifdef WAVES
   // Dump the signals to a VCD file. You can view it with gtkwave.
   initial begin
     $dumpfile("tb.vcd");
     $dumpvars(0, tb);
     #1;
   end
+`endif
 
   // Wire up the inputs and outputs:
+`ifdef HDL_CLOCK
+  wire clk;
+  clkgen clkgen (.clk(clk));
+`else
   reg clk;
+`endif
   reg rst_n;
   reg ena;
   reg [7:0] ui_in;
@@ -30,6 +42,21 @@ module tb ();
   wire halted = uio_oe[1] & uio_out[1];
   wire out_strobe = uio_oe[4] & ~uio_out[4];
 
+  // Capture the program output, so that test.py can read it all at once at the end
+  // of the test, instead of sampling uo_out on every out_strobe:
+  // Bytes past the first 256 are counted but not stored, so test.py can tell.
+  reg [2047:0] out_fifo;  // Up to 256 bytes, the first one in bits [7:0]
+  reg [15:0] out_fifo_count;
+
+  always @(posedge out_strobe or negedge rst_n) begin
+    if (~rst_n) begin
+      out_fifo_count <= 16'd0;
+    end else if (uo_out != 8'd0) begin
+      if (out_fifo_count < 16'd256) out_fifo[{out_fifo_count[7:0], 3'b000}+:8] <= uo_out;
+      out_fifo_count <= out_fifo_count + 16'd1;
+    end
+  end
+
   // Replace tt_um_example with your module name:
   tt_um_urish_sic1 user_project (
 
@@ -1,12 +1,14 @@
 # SPDX-FileCopyrightText: © 2024 Tiny Tapeout
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List
+import os
+from typing import List, Sequence
 
 import cocotb
 import random
 from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles, RisingEdge, Timer
+from cocotb.triggers import ClockCycles, First, RisingEdge, Timer
+from cocotb.utils import get_sim_steps, get_sim_time
 
 ADDR_IN = 253
 ADDR_OUT = 254
@@ -25,108 +27,189 @@ REG_MEM_A = 5
 REG_RESULT = 6
 REG_STATE = 7
 
+# fmt: off
+# Source: programs/print_hello_tinytapeout.sic1
+PROG_HELLO = (
+    0x21, 0x22, 0x03, 0x16, 0x16, 0x06, 0x16, 0x21, 0x09, 0x12, 0x12, 0x0c, 0x12, 0x21, 0x0f, 0x21,
+    0x21, 0x12, 0x21, 0x23, 0xff, 0x21, 0x00, 0x18, 0xfe, 0x21, 0x1b, 0x22, 0x24, 0x1e, 0x21, 0x21,
+    0x00, 0x00, 0x25, 0x00, 0xff, 0x48, 0x65, 0x6c, 0x6c, 0x6f, 0x2c, 0x20, 0x54, 0x69, 0x6e, 0x79,
+    0x20, 0x54, 0x61, 0x70, 0x65, 0x6f, 0x75, 0x74, 0x21, 0x00,
+)
+
+# Source: programs/count_7segment.sic1
+PROG_7SEG = (
+    0x2d, 0x42, 0x03, 0x2e, 0x2e, 0x06, 0x2e, 0x2d, 0x09, 0x2d, 0x2d, 0x0c, 0x2d, 0x2e, 0x0f, 0x22,
+    0x22, 0x12, 0x22, 0x2d, 0x15, 0x1e, 0x1e, 0x18, 0x1e, 0x2d, 0x1b, 0x2d, 0x2d, 0x1e, 0x2d, 0x2f,
+    0x00, 0x2d, 0x00, 0x24, 0xfe, 0x2d, 0x27, 0x2e, 0x30, 0x2a, 0x2d, 0x2d, 0x0c, 0x00, 0x00, 0x00,
+    0xff, 0x3f, 0x06, 0x5b, 0x4f, 0x66, 0x6d, 0x7d, 0x07, 0x7f, 0x6f, 0x77, 0x7c, 0x39, 0x5e, 0x79,
+    0x71, 0x00, 0x31, 0x00,
+)
+# fmt: on
+
+# Clock period: 10 us (100 KHz). clkgen.v must match this when COCOTB_HDL_CLOCK=1.
+CLOCK_PERIOD_US = 10
+
+# When set, the clock is generated by clkgen.v instead of cocotb
+HDL_CLOCK = os.environ.get("COCOTB_HDL_CLOCK") == "1"
+
+GL_TEST = os.environ.get("GATES") == "yes"
+
+# Time for the debug register mux to settle: a single simulator step in RTL, and some
+# slack for the cell unit delays in gate level simulation.
+DEBUG_SETTLE_TIME = (50, "ns") if GL_TEST else (1, "step")
+
 
 class OutputMonitor:
+    # Reads the program output captured by out_fifo in tb.v
     def __init__(self, dut):
         self.dut = dut
-        self.queue = []
-        self._monitor = cocotb.start_soon(self._run())
-
-    async def _run(self):
-        while True:
-            await RisingEdge(self.dut.out_strobe)
-            if int(self.dut.rst_n.value) == 1 and int(self.dut.uo_out.value) != 0:
-                self.queue.append(int(self.dut.uo_out.value))
+        self._start = 0
 
     def get(self):
-        return self.queue
+        count = self.dut.out_fifo_count.value.to_unsigned()
+        assert count <= 256, f"Output overflow: {count} bytes, only 256 captured"
+        data = self.dut.out_fifo.value
+        return [
+            data[8 * i + 7 : 8 * i].to_unsigned() for i in range(self._start, count)
+        ]
 
     def get_string(self):
-        return "".join([chr(c) for c in self.queue])
+        return bytes(self.get()).decode("latin-1")
 
     def clear(self):
-        self.queue = []
+        self._start = self.dut.out_fifo_count.value.to_unsigned()
 
 
 class SIC1Driver:
     def __init__(self, dut):
         self.dut = dut
-        dut.uio_in.value = 0
+        self._clk = dut.clk
+        self._rst_n = dut.rst_n
+        self._ui_in = dut.ui_in
+        self._uo_out = dut.uo_out
+        self._uio_in = dut.uio_in
+        self._halted = dut.halted
+        self._clk_edge = RisingEdge(self._clk)
+        self.output = OutputMonitor(dut)
+        self.set_uio_in(0)
+        self.start()
 
-        # Set the clock period to 10 us (100 KHz)
-        self.clock = Clock(dut.clk, 10, unit="us")
-        cocotb.start_soon(self.clock.start())
+    def start(self):
+        # cocotb kills the clock task when a test ends, so every test restarts it
+        if not HDL_CLOCK:
+            self.clock = Clock(self._clk, CLOCK_PERIOD_US, unit="us")
+            cocotb.start_soon(self.clock.start())
 
-        self.output = OutputMonitor(dut)
+    def set_uio_in(self, value: int):
+        # Remember the value, so debug reads can restore it (reading the handle back
+        # may return a stale value, as cocotb applies writes later in the time step)
+        self._uio_in_value = value
+        self._uio_in.value = value
 
     async def reset(self):
-        self.dut._log.info("Reset")
+        self.dut._log.debug("Reset")
         self.dut.ena.value = 1
-        self.dut.ui_in.value = 0
-        self.dut.uio_in.value = 0
-        self.dut.rst_n.value = 0
-        await ClockCycles(self.dut.clk, 10)
-        self.dut.rst_n.value = 1
-        await ClockCycles(self.dut.clk, 10)
+        self._ui_in.value = 0
+        self.set_uio_in(0)
+        self._rst_n.value = 0
+        await ClockCycles(self._clk, 10)
+        self._rst_n.value = 1
+        await ClockCycles(self._clk, 10)
+        self.output.clear()
+
+    async def soft_reset(self):
+        # The reset is synchronous, so a few clock cycles are enough once the
+        # design went through the full reset. Memory is deliberately left as is:
+        # clearing it byte by byte would take longer than the full reset.
+        self._ui_in.value = 0
+        self.set_uio_in(0)
+        self._rst_n.value = 0
+        await ClockCycles(self._clk, 2)
+        self._rst_n.value = 1
+        await self._clk_edge
+        self.output.clear()
 
     async def set_pc(self, addr: int):
-        self.dut.uio_in.value = UIO_SET_PC
-        self.dut.ui_in.value = addr
-        await ClockCycles(self.dut.clk, 1)
-        self.dut.uio_in.value = 0
+        self.set_uio_in(UIO_SET_PC)
+        self._ui_in.value = addr
+        await self._clk_edge
+        self.set_uio_in(0)
 
     async def write_mem(self, addr: int, data: int):
-        await self.set_pc(addr)
-        self.dut.uio_in.value = UIO_LOAD_DATA
-        self.dut.ui_in.value = data
-        await ClockCycles(self.dut.clk, 1)
-        self.dut.uio_in.value = 0
+        await self.write_mem_bytes(addr, (data,))
 
-    async def write_mem_bytes(self, addr: int, data: List[int]):
+    async def write_mem_bytes(self, addr: int, data: Sequence[int]):
         await self.set_pc(addr)
+        # PC auto-increments on every clock cycle while UIO_LOAD_DATA is held
+        self.set_uio_in(UIO_LOAD_DATA)
         for d in data:
-            self.dut.uio_in.value = UIO_LOAD_DATA
-            self.dut.ui_in.value = d
-            await ClockCycles(self.dut.clk, 1)
-            self.dut.uio_in.value = 0
+            self._ui_in.value = d
+            await self._clk_edge
+        self.set_uio_in(0)
 
     async def step(self, n: int = 1):
-        for _ in range(n):
-            self.dut.uio_in.value = UIO_RUN
-            await ClockCycles(self.dut.clk, 1)
-            self.dut.uio_in.value = 0
-            await ClockCycles(self.dut.clk, 6)  # Each instruction takes 6 clock cycles
-        # An extra clock cycle for outputs to stablize:
-        await ClockCycles(self.dut.clk, 1)
+        # Executes n consecutive instructions: while UIO_RUN is held, the CPU executes
+        # one instruction every 2 clock cycles, and halts after the first instruction
+        # that finishes with UIO_RUN low.
+        self.set_uio_in(UIO_RUN)
+        await ClockCycles(self._clk, 2 * n - 1)
+        self.set_uio_in(0)
+        # Let the last instruction complete, plus an extra cycle for outputs to stablize:
+        await ClockCycles(self._clk, 3)
 
     async def run(self, limit=10000):
-        self.dut.uio_in.value = UIO_RUN
-        await ClockCycles(self.dut.clk, 1)
-        for _ in range(limit):
-            await ClockCycles(self.dut.clk, 1)
-            if self.dut.halted.value:
+        self.set_uio_in(UIO_RUN)
+        await ClockCycles(self._clk, 2)
+        # Let the simulator run until the CPU halts, or `limit` clock cycles pass.
+        # halted is combinational, so only trust it when sampled on a clock edge.
+        end_time = get_sim_time() + get_sim_steps(limit * CLOCK_PERIOD_US, "us")
+        halted_edge = RisingEdge(self._halted)
+        while not self._halted.value:
+            remaining = end_time - get_sim_time()
+            if remaining <= 0:
+                break
+            timeout = Timer(remaining)
+            if await First(halted_edge, timeout) is timeout:
                 break
-        self.dut.uio_in.value = 0
+            await self._clk_edge
+        self.set_uio_in(0)
         # An extra clock cycle for outputs to stablize:
-        await ClockCycles(self.dut.clk, 1)
+        await self._clk_edge
 
     async def debug_read_reg(self, register: int, signed=False):
-        old_uio = self.dut.uio_in.value
-        self.dut.uio_in.value = register << 5
-        await Timer(50, "ns")  # Wait for the value to be propagated
-        result = (
-            self.dut.uo_out.value.to_signed()
-            if signed
-            else self.dut.uo_out.value.to_unsigned()
-        )
-        self.dut.uio_in.value = old_uio
+        return (await self.debug_read_regs([register], signed))[0]
+
+    async def debug_read_regs(
+        self, registers: Sequence[int], signed=False
+    ) -> List[int]:
+        result = []
+        for register in registers:
+            self._uio_in.value = register << 5
+            await Timer(*DEBUG_SETTLE_TIME)  # Wait for the value to be propagated
+            value = self._uo_out.value
+            result.append(value.to_signed() if signed else value.to_unsigned())
+        self._uio_in.value = self._uio_in_value
         return result
 
 
+_shared_driver = None
+
+
+async def get_driver(dut) -> SIC1Driver:
+    # Tests share a single driver: only the first one pays for the full reset
+    global _shared_driver
+    if _shared_driver is None:
+        _shared_driver = SIC1Driver(dut)
+        await _shared_driver.reset()
+    else:
+        _shared_driver.start()
+        await _shared_driver.soft_reset()
+    return _shared_driver
+
+
 @cocotb.test()
 async def test_basic_io(dut):
-    sic1 = SIC1Driver(dut)
-    await sic1.reset()
+    sic1 = await get_driver(dut)
 
     await sic1.write_mem(0x00, ADDR_OUT)
     await sic1.write_mem(0x01, ADDR_IN)
@@ -140,8 +223,7 @@ async def test_basic_io(dut):
 
 @cocotb.test()
 async def test_branching(dut):
-    sic1 = SIC1Driver(dut)
-    await sic1.reset()
+    sic1 = await get_driver(dut)
 
     # fmt: off
     await sic1.write_mem_bytes(0x0, [
@@ -160,41 +242,22 @@ async def test_branching(dut):
 
 @cocotb.test()
 async def test_print_tinytapeout(dut):
-    sic1 = SIC1Driver(dut)
-    await sic1.reset()
+    sic1 = await get_driver(dut)
 
-    # fmt: off
-    # Source: programs/print_hello_tinytapeout.sic1
-    await sic1.write_mem_bytes(0x0, [
-        0x21, 0x22, 0x03, 0x16, 0x16, 0x06, 0x16, 0x21, 0x09, 0x12, 0x12, 0x0c, 0x12, 0x21, 0x0f, 0x21, 
-        0x21, 0x12, 0x21, 0x23, 0xff, 0x21, 0x00, 0x18, 0xfe, 0x21, 0x1b, 0x22, 0x24, 0x1e, 0x21, 0x21,
-        0x00, 0x00, 0x25, 0x00, 0xff, 0x48, 0x65, 0x6c, 0x6c, 0x6f, 0x2c, 0x20, 0x54, 0x69, 0x6e, 0x79,
-        0x20, 0x54, 0x61, 0x70, 0x65, 0x6f, 0x75, 0x74, 0x21, 0x00
-    ])
-    # fmt: on
+    await sic1.write_mem_bytes(0x0, PROG_HELLO)
 
     await sic1.set_pc(0x00)
     await sic1.run()
 
-    dut._log.info(f"Program output: {sic1.output.get_string()}")
+    dut._log.debug(f"Program output: {sic1.output.get_string()}")
     assert sic1.output.get_string() == "Hello, Tiny Tapeout!"
 
 
 @cocotb.test()
 async def test_count_7segment(dut):
-    sic1 = SIC1Driver(dut)
-    await sic1.reset()
+    sic1 = await get_driver(dut)
 
-    # fmt: off
-    # Source: programs/count_7segment.sic1
-    await sic1.write_mem_bytes(0x0, [
-        0x2d, 0x42, 0x03, 0x2e, 0x2e, 0x06, 0x2e, 0x2d, 0x09, 0x2d, 0x2d, 0x0c, 0x2d, 0x2e, 0x0f, 0x22,
-        0x22, 0x12, 0x22, 0x2d, 0x15, 0x1e, 0x1e, 0x18, 0x1e, 0x2d, 0x1b, 0x2d, 0x2d, 0x1e, 0x2d, 0x2f,
-        0x00, 0x2d, 0x00, 0x24, 0xfe, 0x2d, 0x27, 0x2e, 0x30, 0x2a, 0x2d, 0x2d, 0x0c, 0x00, 0x00, 0x00,
-        0xff, 0x3f, 0x06, 0x5b, 0x4f, 0x66, 0x6d, 0x7d, 0x07, 0x7f, 0x6f, 0x77, 0x7c, 0x39, 0x5e, 0x79,
-        0x71, 0x00, 0x31, 0x00,
-    ])
-    # fmt: on
+    await sic1.write_mem_bytes(0x0, PROG_7SEG)
 
     await sic1.set_pc(0x00)
     await sic1.run(limit=500)
@@ -228,8 +291,7 @@ async def test_count_7segment(dut):
 
 @cocotb.test()
 async def test_debug_interface(dut):
-    sic1 = SIC1Driver(dut)
-    await sic1.reset()
+    sic1 = await get_driver(dut)
 
     assert await sic1.debug_read_reg(REG_PC) == 0
 
@@ -241,21 +303,23 @@ async def test_debug_interface(dut):
     await sic1.write_mem(0x26, 0x47)
     await sic1.set_pc(0x10)
 
-    assert await sic1.debug_read_reg(REG_PC) == 0x10
-    assert await sic1.debug_read_reg(REG_STATE) == 0  # Halt
-    dut.uio_in.value = UIO_RUN
-    await ClockCycles(dut.clk, 1)
-    assert await sic1.debug_read_reg(REG_STATE) == 1  # Read Inst
-    assert await sic1.debug_read_reg(REG_A) == 0x25
-    assert await sic1.debug_read_reg(REG_B) == 0x26
-    assert await sic1.debug_read_reg(REG_C) == 0x13
-    await ClockCycles(dut.clk, 1)
-    assert await sic1.debug_read_reg(REG_STATE) == 2  # Read Data
-    assert await sic1.debug_read_reg(REG_MEM_A) == 0x42
+    assert await sic1.debug_read_regs([REG_PC, REG_STATE]) == [0x10, 0]  # Halt
+    sic1.set_uio_in(UIO_RUN)
+    await RisingEdge(dut.clk)
+    state, reg_a, reg_b, reg_c = await sic1.debug_read_regs(
+        [REG_STATE, REG_A, REG_B, REG_C]
+    )
+    assert state == 1  # Read Inst
+    assert reg_a == 0x25
+    assert reg_b == 0x26
+    assert reg_c == 0x13
+    sic1.set_uio_in(0)  # Halt after the current instruction
+    await RisingEdge(dut.clk)
+    assert await sic1.debug_read_regs([REG_STATE, REG_MEM_A]) == [2, 0x42]  # Read Data
     assert await sic1.debug_read_reg(REG_RESULT, True) == 0x42 - 0x47
-    await ClockCycles(dut.clk, 1)
+    await RisingEdge(dut.clk)
     assert await sic1.debug_read_reg(REG_STATE) == 0  # Halt
-    dut.uio_in.value = UIO_RUN
+    sic1.set_uio_in(UIO_RUN)
     await ClockCycles(dut.clk, 2)
     assert await sic1.debug_read_reg(REG_STATE) == 2  # Read Data
     assert await sic1.debug_read_reg(REG_MEM_A, True) == 0x42 - 0x47
@@ -263,18 +327,18 @@ async def test_debug_interface(dut):
 
 @cocotb.test()
 async def test_internal_memory(dut):
-    sic1 = SIC1Driver(dut)
-    await sic1.reset()
+    sic1 = await get_driver(dut)
 
     rand = random.Random(123)
     data = rand.sample(range(256), k=253)
 
     # Load data into internal memory
-    for addr, value in enumerate(data):
-        await sic1.write_mem(addr, value)
+    await sic1.write_mem_bytes(0, data)
 
     # Read back in random order and verify
-    for addr in rand.sample(range(253), k=253):
+    order = list(range(len(data)))
+    rand.shuffle(order)
+    for addr in order:
         await sic1.set_pc(addr)
         value = await sic1.debug_read_reg(REG_MEM_A)
         expected = data[addr]